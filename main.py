@@ -1,10 +1,16 @@
 import sys
 import os
 import csv
+import io
+import itertools
+import mmap
+import hashlib
+import shelve
+from types import MappingProxyType
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
-ERROR_COLUMNS = [
+ERROR_COLUMNS = (
     "Grammar",
     "Factuality",
     "Hallucination",
@@ -14,14 +20,30 @@ ERROR_COLUMNS = [
     "Coherency",
     "Commonsense",
     "Arithmetic"
-]
+)
 
-REQUIRED_COLUMNS = [
+REQUIRED_COLUMNS = (
     "question",
     "true_answer",
     "predicted_answer_full",
     "is_correct"
-] + ERROR_COLUMNS
+) + ERROR_COLUMNS
+
+# Read-only template answer set: every error column answered "No"
+_DEFAULT_RESPONSES = MappingProxyType(dict.fromkeys(ERROR_COLUMNS, "No"))
+
+# Rows exposed to the view per fetchMore() call
+FETCH_BATCH_SIZE = 500
+
+# Rows parsed between progress updates while loading a CSV
+LOAD_CHUNK_ROWS = 5000
+
+# Write buffer for save_csv, so large files go out in few syscalls
+SAVE_BUFFER_SIZE = 1 << 20
+
+# On-disk store of in-progress annotations, next to the saved results;
+# holds one shelve per source CSV
+ANNOTATION_CACHE_DIR = os.path.join("results", ".annotation_cache")
 
 ERROR_QUESTION_TEXTS = {
     "Grammar": """**Grammar Error**
@@ -62,14 +84,125 @@ ERROR_QUESTION_TEXTS = {
 """
 }
 
+# Rendered question pages, built on first use (a QTextDocument needs the
+# QApplication) and shared by every DetailedClassificationWindow
+_QUESTION_DOCS = {}
+
+
+def _question_doc(err_key):
+    doc = _QUESTION_DOCS.get(err_key)
+    if doc is None:
+        doc = QtGui.QTextDocument()
+        doc.setHtml(ERROR_QUESTION_TEXTS.get(err_key, f"{err_key} question not found."))
+        _QUESTION_DOCS[err_key] = doc
+    return doc
+
+
+def _parse_bool_column(values):
+    """Map each cell to True if it reads "true" after strip/lower.
+
+    A column like is_correct holds only a handful of distinct spellings, so
+    each one is normalised once and the rest is a C-level dict lookup.
+    """
+    canonical = {v: v.strip().lower() == "true" for v in set(values)}
+    return list(map(canonical.__getitem__, values))
+
+
+class AnnotationCache:
+    """Error labels per row of one source CSV, persisted across sessions.
+
+    Each source CSV gets its own shelve, named by a hash of the file's
+    absolute path and mtime, so editing the source CSV invalidates it. Rows
+    are stored under their own keys, so saving a row is a single write.
+    The cache is best-effort: a failure to read or write it never
+    interrupts annotation.
+    """
+
+    def __init__(self, file_path, cache_dir=ANNOTATION_CACHE_DIR):
+        stat = os.stat(file_path)
+        ident = f"{os.path.abspath(file_path)}\0{stat.st_mtime_ns}"
+        self._cache_dir = cache_dir
+        self._cache_path = os.path.join(cache_dir, hashlib.sha256(ident.encode("utf-8")).hexdigest())
+        # Opened on the first store() and kept open until close()
+        self._db = None
+
+    def load(self):
+        """Return {row_index: {error_column: label}} saved for this file"""
+        entries = {}
+        try:
+            with shelve.open(self._cache_path, flag="r") as db:
+                for row in db.keys():
+                    # A damaged entry only loses its own row
+                    try:
+                        entries[int(row)] = db[row]
+                    except Exception:
+                        continue
+        except Exception:
+            pass
+        return entries
+
+    def store(self, row, labels):
+        try:
+            if self._db is None:
+                os.makedirs(self._cache_dir, exist_ok=True)
+                self._db = shelve.open(self._cache_path)
+            self._db[str(row)] = dict(labels)
+            # Flush per row so a crash keeps it; dbm.dumb otherwise only
+            # updates the index of an overwritten key in memory
+            self._db.sync()
+        except Exception:
+            pass
+
+    def close(self):
+        if self._db is not None:
+            try:
+                self._db.close()
+            except Exception:
+                pass
+            self._db = None
+
+
 class CSVTableModel(QtCore.QAbstractTableModel):
-    def __init__(self, data=None, headers=None, parent=None):
+    def __init__(self, columns=None, headers=None, annotation_cache=None, parent=None):
         super().__init__(parent)
-        self._data = data if data else []
+        self._annotation_cache = annotation_cache
+        # Column-major store: one list of cell strings per header name
+        self._columns = columns if columns else {}
         self._headers = headers if headers else []
+        # The same lists indexed by column position, so data() skips the
+        # header lookup and dict hash on every paint
+        self._cells = [self._columns[name] for name in self._headers]
+        self._nrows = len(self._cells[0]) if self._cells else 0
+        # Only this many rows are reported to the view; the rest are handed
+        # out in batches by fetchMore() as the user scrolls
+        self._loaded = min(self._nrows, FETCH_BATCH_SIZE)
+        # is_correct parsed once up front, so row navigation never re-parses it
+        self._is_correct = _parse_bool_column(self._columns.get("is_correct", ()))
+        # One byte per row, set when its labels change after the last save
+        self._dirty = bytearray(self._nrows)
 
     def rowCount(self, parent=QtCore.QModelIndex()):
-        return len(self._data)
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def totalRowCount(self):
+        return self._nrows
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self._nrows
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(FETCH_BATCH_SIZE, self._nrows - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QtCore.QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
 
     def columnCount(self, parent=QtCore.QModelIndex()):
         return len(self._headers)
@@ -78,10 +211,7 @@ class CSVTableModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
         if role == QtCore.Qt.DisplayRole:
-            row = index.row()
-            col = index.column()
-            header_name = self._headers[col]
-            return self._data[row].get(header_name, "")
+            return self._cells[index.column()][index.row()]
         return None
 
     def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
@@ -99,8 +229,56 @@ class CSVTableModel(QtCore.QAbstractTableModel):
         # Read-only cells
         return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
 
-    def getDataList(self):
-        return self._data
+    def value(self, row, column):
+        return self._columns[column][row]
+
+    def set_errors(self, row, labels):
+        """Write one row's error labels and mirror them to the annotation cache.
+
+        A row whose labels are unchanged is left clean and not re-cached.
+        Returns whether anything changed.
+        """
+        changed = False
+        for col in ERROR_COLUMNS:
+            column = self._columns[col]
+            if column[row] != labels[col]:
+                column[row] = labels[col]
+                changed = True
+        if not changed:
+            return False
+        self._dirty[row] = 1
+        if self._annotation_cache is not None:
+            self._annotation_cache.store(row, labels)
+        return True
+
+    def is_correct(self, row):
+        return self._is_correct[row]
+
+    def has_unsaved_changes(self):
+        return any(self._dirty)
+
+    def mark_saved(self):
+        self._dirty = bytearray(self._nrows)
+
+    def notify_rows_changed(self, rows):
+        """Emit dataChanged over the error columns for each contiguous run of rows"""
+        error_cols = [i for i, name in enumerate(self._headers) if name in ERROR_COLUMNS]
+        # Rows not fetched yet are not in the view and need no repaint
+        rows = sorted(r for r in rows if r < self._loaded)
+        if not error_cols or not rows:
+            return
+        left, right = min(error_cols), max(error_cols)
+        start = prev = rows[0]
+        for r in rows[1:] + [None]:
+            if r is not None and r == prev + 1:
+                prev = r
+                continue
+            self.dataChanged.emit(self.index(start, left), self.index(prev, right), [QtCore.Qt.DisplayRole])
+            if r is not None:
+                start = prev = r
+
+    def getColumns(self):
+        return self._columns
 
     def getHeaders(self):
         return self._headers
@@ -117,11 +295,11 @@ class DetailedClassificationWindow(QtWidgets.QDialog):
         self.total_rows = total_rows
 
         if initial_values is not None:
-            self.responses = dict(initial_values)  
+            self.responses = {**_DEFAULT_RESPONSES, **initial_values}
         else:
-            self.responses = {col: "No" for col in ERROR_COLUMNS}
+            self.responses = dict(_DEFAULT_RESPONSES)
 
-        self.error_keys = ERROR_COLUMNS[:]
+        self.error_keys = ERROR_COLUMNS
         self.current_idx = 0
 
         main_layout = QtWidgets.QVBoxLayout()
@@ -160,11 +338,10 @@ class DetailedClassificationWindow(QtWidgets.QDialog):
     def load_current_question(self):
         if 0 <= self.current_idx < len(self.error_keys):
             err_key = self.error_keys[self.current_idx]
-            text = ERROR_QUESTION_TEXTS.get(err_key, f"{err_key} question not found.")
-            self.question_label.setHtml(text)
+            self.question_label.setDocument(_question_doc(err_key))
 
             val = self.responses.get(err_key, "No")
-            if val not in ["Yes", "No"]:
+            if val not in ("Yes", "No"):
                 val = "No"
             self.answer_combo.setCurrentText(val)
         else:
@@ -197,15 +374,17 @@ class DetailedClassificationWindow(QtWidgets.QDialog):
 
 
 class RowOverviewWindow(QtWidgets.QDialog):
-    def __init__(self, csv_data,row_number = 1, parent=None):
+    def __init__(self, model, row_number = 1, parent=None):
         super().__init__(parent)
-        self.csv_data = csv_data
+        self.model = model
         self.current_index = row_number - 1
+        # Rows whose labels changed during this session
+        self._dirty_rows = set()
 
-        self.row_label = QtWidgets.QLabel(f"Row {self.current_index + 1} of {len(self.csv_data)}")
+        self.row_label = QtWidgets.QLabel(f"Row {self.current_index + 1} of {self.model.totalRowCount()}")
         self.row_label.setAlignment(QtCore.Qt.AlignCenter)
 
-        self.setWindowTitle(f"Row Overview - Row {self.current_index+1}/{len(self.csv_data)}")
+        self.setWindowTitle(f"Row Overview - Row {self.current_index+1}/{self.model.totalRowCount()}")
         self.setMinimumSize(900, 600)
 
         main_layout = QtWidgets.QVBoxLayout()
@@ -276,44 +455,49 @@ class RowOverviewWindow(QtWidgets.QDialog):
         self.load_row_into_ui(self.current_index)
 
     def load_row_into_ui(self, index):
-        if index < 0 or index >= len(self.csv_data):
+        if index < 0 or index >= self.model.totalRowCount():
             return
         
         self.current_index = index
-        row = self.csv_data[index]
-        question_text = row.get("question", "")
-        true_text = row.get("true_answer", "")
-        pred_text = row.get("predicted_answer_full", "")
+        # Coalesce the text, label and combo updates below into one repaint
+        self.setUpdatesEnabled(False)
+        for combo in self.error_combos.values():
+            combo.blockSignals(True)
+        try:
+            question_text = self.model.value(index, "question")
+            true_text = self.model.value(index, "true_answer")
+            pred_text = self.model.value(index, "predicted_answer_full")
 
-        self.question_edit.setPlainText(question_text)
-        self.true_answer_edit.setPlainText(true_text)
-        self.pred_answer_edit.setPlainText(pred_text)
+            self.question_edit.setPlainText(question_text)
+            self.true_answer_edit.setPlainText(true_text)
+            self.pred_answer_edit.setPlainText(pred_text)
 
-        self.setWindowTitle(f"Row Overview - Row {self.current_index + 1}/{len(self.csv_data)}")
-        self.row_label.setText(f"Row {self.current_index + 1} of {len(self.csv_data)}")
+            self.setWindowTitle(f"Row Overview - Row {self.current_index + 1}/{self.model.totalRowCount()}")
+            self.row_label.setText(f"Row {self.current_index + 1} of {self.model.totalRowCount()}")
 
-        is_correct = row.get("is_correct", "").strip().lower()
-        if is_correct == "true":
-            # Lock combos to "No"
-            for col in ERROR_COLUMNS:
-                self.error_combos[col].setCurrentText("No")
-                self.error_combos[col].setEnabled(False)
-            self.detail_btn.setEnabled(False)
-        else:
-            self.detail_btn.setEnabled(True)
-            for col in ERROR_COLUMNS:
-                self.error_combos[col].setEnabled(True)
-                val = row.get(col, "")
-                if val not in ["Yes", "No"]:
-                    val = "No"
-                self.error_combos[col].setCurrentText(val)
+            if self.model.is_correct(index):
+                # Lock combos to "No"
+                for col in ERROR_COLUMNS:
+                    self.error_combos[col].setCurrentText("No")
+                    self.error_combos[col].setEnabled(False)
+                self.detail_btn.setEnabled(False)
+            else:
+                self.detail_btn.setEnabled(True)
+                for col in ERROR_COLUMNS:
+                    self.error_combos[col].setEnabled(True)
+                    val = self.model.value(index, col)
+                    if val not in ("Yes", "No"):
+                        val = "No"
+                    self.error_combos[col].setCurrentText(val)
+        finally:
+            for combo in self.error_combos.values():
+                combo.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
     def open_detailed_classification(self):
-        if self.current_index < 0 or self.current_index >= len(self.csv_data):
+        if self.current_index < 0 or self.current_index >= self.model.totalRowCount():
             return
-        row = self.csv_data[self.current_index]
-        is_correct = row.get("is_correct", "").strip().lower()
-        if is_correct == "true":
+        if self.model.is_correct(self.current_index):
             QtWidgets.QMessageBox.information(self, "Skipped", "This row is correct. No classification needed.")
             return
 
@@ -321,26 +505,24 @@ class RowOverviewWindow(QtWidgets.QDialog):
         for col in ERROR_COLUMNS:
             current_answers[col] = self.error_combos[col].currentText()
 
-        dialog = DetailedClassificationWindow(initial_values=current_answers,row_number=self.current_index+1, total_rows=len(self.csv_data), parent=self)
+        dialog = DetailedClassificationWindow(initial_values=current_answers,row_number=self.current_index+1, total_rows=self.model.totalRowCount(), parent=self)
         if dialog.exec_() == QtWidgets.QDialog.Accepted:
             final_responses = dialog.get_responses()
             for col in ERROR_COLUMNS:
                 self.error_combos[col].setCurrentText(final_responses[col])
 
     def save_current_row(self):
-        if 0 <= self.current_index < len(self.csv_data):
-            row = self.csv_data[self.current_index]
-            is_correct = row.get("is_correct", "").strip().lower()
-            if is_correct == "true":
-                for col in ERROR_COLUMNS:
-                    row[col] = "No"
+        if 0 <= self.current_index < self.model.totalRowCount():
+            if self.model.is_correct(self.current_index):
+                labels = _DEFAULT_RESPONSES
             else:
-                for col in ERROR_COLUMNS:
-                    row[col] = self.error_combos[col].currentText()
+                labels = {col: self.error_combos[col].currentText() for col in ERROR_COLUMNS}
+            if self.model.set_errors(self.current_index, labels):
+                self._dirty_rows.add(self.current_index)
 
     def save_and_next_row(self):
         self.save_current_row()
-        if self.current_index + 1 < len(self.csv_data):
+        if self.current_index + 1 < self.model.totalRowCount():
             self.current_index += 1
             self.load_row_into_ui(self.current_index)
         else:
@@ -359,6 +541,140 @@ class RowOverviewWindow(QtWidgets.QDialog):
         self.save_current_row()
         self.accept()
 
+    def get_dirty_rows(self):
+        return self._dirty_rows
+
+
+class MissingColumnsError(ValueError):
+    def __init__(self, missing):
+        super().__init__(f"CSV is missing required columns:\n{missing}")
+        self.missing = missing
+
+
+class CsvTaskSignals(QtCore.QObject):
+    # progress in percent; finished carries the task result, or None if
+    # the task was cancelled; failed carries the raised exception
+    progress = QtCore.pyqtSignal(int)
+    finished = QtCore.pyqtSignal(object)
+    failed = QtCore.pyqtSignal(object)
+
+
+class CsvLoader(QtCore.QRunnable):
+    """Parses a CSV into column lists on a QThreadPool worker.
+
+    finished emits (file_path, columns, headers, annotation_cache); the
+    model itself is built by the receiver on the GUI thread.
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = CsvTaskSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        try:
+            result = self._read()
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.finished.emit(result)
+
+    def _read(self):
+        file_path = self.file_path
+        file_size = os.path.getsize(file_path)
+        # Map the file read-only and let csv.reader pull decoded lines
+        # straight from the page cache instead of a buffered text copy.
+        # mmap refuses empty files, so those read as an empty buffer.
+        with open(file_path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if file_size else io.BytesIO()
+        with buf:
+            reader = csv.reader(line.decode("utf-8") for line in iter(buf.readline, b""))
+            headers = next(reader, [])
+            width = len(headers)
+            # headers keeps the column order, header_set answers membership
+            header_set = set(headers)
+
+            for col in ERROR_COLUMNS:
+                if col not in header_set:
+                    headers.append(col)
+                    header_set.add(col)
+
+            missing = [c for c in REQUIRED_COLUMNS if c not in header_set]
+            if missing:
+                raise MissingColumnsError(missing)
+
+            # Single pass over the file in chunks, each transposed with
+            # zip() so the per-cell work stays in C. Row widths are
+            # checked in C too; only a chunk with ragged rows takes the
+            # Python pass that pads short rows and drops stray cells.
+            # Progress is the byte offset into the mapped file.
+            cells = [[] for _ in range(width)]
+            while True:
+                chunk = list(itertools.islice(reader, LOAD_CHUNK_ROWS))
+                if not chunk:
+                    break
+                if set(map(len, chunk)) != {width}:
+                    # Blank lines come back as [] and are dropped, as
+                    # DictReader did
+                    chunk = [
+                        row if len(row) == width else (row + [""] * width)[:width]
+                        for row in chunk if row
+                    ]
+                for column, values in zip(cells, zip(*chunk)):
+                    column.extend(values)
+                self.signals.progress.emit(buf.tell() * 100 // max(file_size, 1))
+                if self._cancelled:
+                    return None
+
+        nrows = len(cells[0])
+        columns = dict(zip(headers, cells))
+        for col in ERROR_COLUMNS:
+            if col not in columns:
+                columns[col] = ["No"] * nrows
+
+        # Restore labels from an earlier session on this same file
+        annotation_cache = AnnotationCache(file_path)
+        for row, labels in annotation_cache.load().items():
+            if row < nrows:
+                for col in ERROR_COLUMNS:
+                    columns[col][row] = labels.get(col, "No")
+
+        return file_path, columns, headers, annotation_cache
+
+
+class CsvSaver(QtCore.QRunnable):
+    """Writes the model's column lists to out_path on a QThreadPool worker"""
+
+    def __init__(self, columns, headers, out_path):
+        super().__init__()
+        self.columns = columns
+        self.headers = headers
+        self.out_path = out_path
+        self.signals = CsvTaskSignals()
+
+    def run(self):
+        columns = self.columns
+        headers = self.headers
+        try:
+            with open(self.out_path, "w", newline="", encoding="utf-8", buffering=SAVE_BUFFER_SIZE) as f:
+                # Rows are zipped straight from the column lists, so the
+                # whole write runs inside csv.writer's C loop
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(zip(*(columns[h] for h in headers)))
+        except Exception as e:
+            self.signals.failed.emit(e)
+            return
+        self.signals.progress.emit(100)
+        self.signals.finished.emit(self.out_path)
+
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
@@ -391,69 +707,127 @@ class MainWindow(QtWidgets.QMainWindow):
         self.save_btn.setEnabled(False)
         btn_layout.addWidget(self.save_btn)
 
-        # TableView
+        self.autosize_btn = QtWidgets.QPushButton("Autosize Columns")
+        self.autosize_btn.clicked.connect(self.autosize_columns)
+        self.autosize_btn.setEnabled(False)
+        btn_layout.addWidget(self.autosize_btn)
+
+        # TableView; fixed default widths so loading never measures cell text
         self.table_view = QtWidgets.QTableView()
+        header = self.table_view.horizontalHeader()
+        header.setDefaultSectionSize(150)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
         main_layout.addWidget(self.table_view, stretch=1)
 
         self.model = None
         self.csv_file_path = None
+        self._csv_task = None
+        self._progress = None
+        self._annotation_cache = None
+        # Output path of the last successful save of the current model
+        self._saved_path = None
+
+    def closeEvent(self, event):
+        if self._annotation_cache is not None:
+            self._annotation_cache.close()
+            self._annotation_cache = None
+        super().closeEvent(event)
 
     def load_csv(self):
-        dlg = QtWidgets.QFileDialog(self)
-        dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
-        file_path, _ = dlg.getOpenFileName(self, "Open CSV", "", "CSV Files (*.csv);;All Files (*)")
+        file_path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Open CSV", "", "CSV Files (*.csv);;All Files (*)")
         if not file_path:
             return
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                headers = reader.fieldnames
-
-                for col in ERROR_COLUMNS:
-                    if col not in headers:
-                        headers.append(col)
-
-                missing = [c for c in REQUIRED_COLUMNS if c not in headers]
-                if missing:
-                    QtWidgets.QMessageBox.warning(
-                        self, "Missing Columns",
-                        f"CSV is missing required columns:\n{missing}"
-                    )
-                    return
-
-                data = list(reader)
-
-                for row in data:
-                    for col in ERROR_COLUMNS:
-                        if col not in row:
-                            row[col] = "No"
-
-
-            self.model = CSVTableModel(data, headers)
-            self.table_view.setModel(self.model)
+        # Flush and release the open cache so the loader reads this session's
+        # labels; if the load is cancelled the cache reopens on its next store()
+        if self._annotation_cache is not None:
+            self._annotation_cache.close()
+
+        loader = CsvLoader(file_path)
+        loader.signals.finished.connect(self._on_csv_loaded)
+        loader.signals.failed.connect(self._on_csv_load_failed)
+        self._start_csv_task(loader, "Loading CSV...")
+
+    def _on_csv_loaded(self, result):
+        # Cancel may land after the worker already emitted its result
+        cancelled = self._csv_task.is_cancelled()
+        self._finish_csv_task()
+        if result is None or cancelled:
+            # Cancelled from the progress dialog
+            return
+        file_path, columns, headers, annotation_cache = result
+
+        if self._annotation_cache is not None:
+            self._annotation_cache.close()
+        self._annotation_cache = annotation_cache
+        self.model = CSVTableModel(columns, headers, annotation_cache)
+        self.table_view.setModel(self.model)
+        self._saved_path = None
+
+        self.csv_file_path = file_path
+        self.annotate_btn.setEnabled(True)
+        self.save_btn.setEnabled(True)
+        self.autosize_btn.setEnabled(True)
+
+    def _on_csv_load_failed(self, error):
+        self._finish_csv_task()
+        if isinstance(error, MissingColumnsError):
+            QtWidgets.QMessageBox.warning(self, "Missing Columns", str(error))
+        else:
+            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load CSV:\n{error}")
+
+    def _start_csv_task(self, task, label, cancellable=True):
+        """Run a CsvLoader/CsvSaver on the global thread pool behind a progress dialog"""
+        self._set_busy(True)
+        progress = QtWidgets.QProgressDialog(label, "Cancel", 0, 100, self)
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        task.signals.progress.connect(progress.setValue)
+        if cancellable:
+            # Routed through MainWindow: the runnable is not a QObject and
+            # its C++ side is gone once run() returns
+            progress.canceled.connect(self._cancel_csv_task)
+        else:
+            progress.setCancelButton(None)
+        self._csv_task = task
+        self._progress = progress
+        QtCore.QThreadPool.globalInstance().start(task)
+
+    def _cancel_csv_task(self):
+        if self._csv_task is not None:
+            self._csv_task.cancel()
+
+    def _finish_csv_task(self):
+        if self._progress is not None:
+            self._progress.close()
+            self._progress.deleteLater()
+        self._progress = None
+        self._csv_task = None
+        self._set_busy(False)
+
+    def _set_busy(self, busy):
+        # Keep the buttons off while a worker owns the column lists
+        self.load_btn.setEnabled(not busy)
+        has_model = self.model is not None
+        for btn in (self.annotate_btn, self.save_btn, self.autosize_btn):
+            btn.setEnabled(has_model and not busy)
+
+    def autosize_columns(self):
+        if self.model:
             self.table_view.resizeColumnsToContents()
 
-            self.csv_file_path = file_path
-            self.annotate_btn.setEnabled(True)
-            self.save_btn.setEnabled(True)
-
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to load CSV:\n{e}")
-
     def annotate_rows(self):
         if not self.model:
             return
-        data = self.model.getDataList()
-        if not data:
+        if not self.model.totalRowCount():
             QtWidgets.QMessageBox.information(self, "No Data", "No rows to annotate.")
             return
 
-        dialog = RowOverviewWindow(data, parent=self)
-        if dialog.exec_() == QtWidgets.QDialog.Accepted:
-            self.table_view.reset()
-        else:
-            self.table_view.reset()
+        dialog = RowOverviewWindow(self.model, parent=self)
+        dialog.exec_()
+        # Rows are saved on every Previous/Next, so repaint them whether the
+        # dialog was finished or closed
+        self.model.notify_rows_changed(dialog.get_dirty_rows())
 
     def save_csv(self):
         if not self.model or not self.csv_file_path:
@@ -465,26 +839,27 @@ class MainWindow(QtWidgets.QMainWindow):
         out_name = f"annotated_{orig_name}"
         out_path = os.path.join("results", out_name)
 
-        data = self.model.getDataList()
-        headers = self.model.getHeaders()
-
-        for col in ERROR_COLUMNS:
-            if col not in headers:
-                headers.append(col)
-
-        try:
-            with open(out_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-                for row in data:
-                    for col in ERROR_COLUMNS:
-                        if col not in row:
-                            row[col] = "No"
-                    writer.writerow(row)
+        # Nothing edited since this exact file was last written
+        if out_path == self._saved_path and os.path.exists(out_path) and not self.model.has_unsaved_changes():
+            QtWidgets.QMessageBox.information(self, "Saved", f"No changes since last save: {out_path}")
+            return
 
+        saver = CsvSaver(self.model.getColumns(), self.model.getHeaders(), out_path)
+        saver.signals.finished.connect(self._on_csv_saved)
+        saver.signals.failed.connect(self._on_csv_save_failed)
+        # A save is a single writerows() call, so it offers no Cancel
+        self._start_csv_task(saver, "Saving CSV...", cancellable=False)
+
+    def _on_csv_saved(self, out_path):
+        self._finish_csv_task()
+        if out_path is not None:
+            self.model.mark_saved()
+            self._saved_path = out_path
             QtWidgets.QMessageBox.information(self, "Saved", f"CSV saved to: {out_path}")
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save CSV:\n{e}")
+
+    def _on_csv_save_failed(self, error):
+        self._finish_csv_task()
+        QtWidgets.QMessageBox.critical(self, "Error", f"Failed to save CSV:\n{error}")
 
 
 def main():